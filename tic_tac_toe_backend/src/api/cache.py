@@ -0,0 +1,76 @@
+import logging
+import os
+from typing import Optional
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from dotenv import load_dotenv
+
+# Load environment variables from .env if present
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Caching is disabled when REDIS_URL is not configured
+REDIS_URL = os.getenv("REDIS_URL")
+GAME_STATE_TTL = int(os.getenv("GAME_STATE_CACHE_TTL", "30"))
+
+redis_client: Optional[Redis] = Redis.from_url(REDIS_URL, decode_responses=True) if REDIS_URL else None
+
+# Entries are hashes of {version, data}. The write is skipped when the cached version is already
+# at least as new, so a delayed or reordered writer can never replace a fresher value.
+_SET_IF_NEWER = """
+local current = redis.call('HGET', KEYS[1], 'version')
+if current and tonumber(current) >= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'version', ARGV[2], 'data', ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+_set_if_newer = redis_client.register_script(_SET_IF_NEWER) if redis_client is not None else None
+
+
+# PUBLIC_INTERFACE
+def game_state_key(game_id: int) -> str:
+    """Returns the namespaced cache key for a game's serialized state."""
+    return f"game:{game_id}"
+
+
+# PUBLIC_INTERFACE
+async def cache_get(key: str) -> Optional[str]:
+    """Returns the cached value for key, or None on a miss, when caching is disabled or Redis is unavailable."""
+    if redis_client is None:
+        return None
+    try:
+        return await redis_client.hget(key, "data")
+    except (RedisError, OSError):
+        logger.warning("Cache read failed for %s; falling back to the database", key, exc_info=True)
+        return None
+
+
+# PUBLIC_INTERFACE
+async def cache_set(key: str, value: str, version: int, ttl: int = GAME_STATE_TTL) -> bool:
+    """Stores value under key with an expiry of ttl seconds, unless the cached version is already >= version.
+
+    Returns False only when the write failed; failures are logged, since the database remains the
+    source of truth.
+    """
+    if _set_if_newer is None:
+        return True
+    try:
+        await _set_if_newer(keys=[key], args=[value, version, ttl])
+        return True
+    except (RedisError, OSError):
+        logger.warning("Cache write failed for %s", key, exc_info=True)
+        return False
+
+
+# PUBLIC_INTERFACE
+async def cache_delete(key: str) -> None:
+    """Evicts key from the cache; failures are logged and ignored."""
+    if redis_client is None:
+        return
+    try:
+        await redis_client.delete(key)
+    except (RedisError, OSError):
+        logger.warning("Cache eviction failed for %s", key, exc_info=True)
@@ -17,7 +17,27 @@ DB_URL = (
     f"mysql+aiomysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DB}"
 )
 
-engine = create_async_engine(DB_URL, echo=True, future=True)
+# SQL statement logging is expensive on the hot path; enable only for debugging
+SQL_ECHO = os.getenv("SQL_ECHO", "0") == "1"
+
+# Connection pool sizing; defaults are sized for ~100 concurrent requests
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+engine = create_async_engine(
+    DB_URL,
+    echo=SQL_ECHO,
+    future=True,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    # Timestamps are generated by NOW(); pin sessions to UTC so they stay naive UTC like existing rows
+    connect_args={"init_command": "SET time_zone = '+00:00'"},
+)
 AsyncSessionLocal = sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
 Base = declarative_base()
 
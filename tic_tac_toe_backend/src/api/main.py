@@ -1,5 +1,7 @@
+import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from .routes import router
 
 app = FastAPI(
@@ -8,15 +10,23 @@ app = FastAPI(
     version="0.1.0",
     openapi_tags=[
         {"name": "Game", "description": "Game creation, moves, and listing endpoints."},
-    ]
+    ],
+    default_response_class=ORJSONResponse,
 )
 
+# Credentialed CORS requires explicit origins; comma-separated list of allowed frontend origins
+FRONTEND_ORIGINS = [
+    origin.strip() for origin in os.getenv("FRONTEND_ORIGIN", "http://localhost:3000").split(",") if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=FRONTEND_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "If-None-Match"],
+    expose_headers=["ETag"],
+    max_age=86400,  # let browsers cache preflight responses for a day
 )
 
 # Main API router for all core endpoints
@@ -1,11 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException
+from functools import lru_cache
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import or_
-from typing import List, Optional, Literal
-from pydantic import BaseModel, Field
+from sqlalchemy import union_all, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
+from typing import Dict, Iterable, List, Optional, Literal
+from pydantic import BaseModel, ConfigDict, Field
 from .db import get_db
-from .models import User, Game, Move
+from .cache import cache_get, cache_set, cache_delete, game_state_key
+from .models import User, Game
 
 router = APIRouter()
 
@@ -15,8 +19,7 @@ class UserSchema(BaseModel):
     id: int
     username: str
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class GameCreate(BaseModel):
     player_x_id: int = Field(..., description="User ID for X")
@@ -32,8 +35,7 @@ class GameState(BaseModel):
     created_at: str
     updated_at: str
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class MoveRequest(BaseModel):
     player_id: int = Field(..., description="User ID making the move")
@@ -47,27 +49,31 @@ class GameListItem(BaseModel):
     updated_at: str
     opponent: UserSchema
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 # --- Utility/game logic ---
-def get_current_turn(state: str) -> str:
+def get_current_turn(move_count: int) -> str:
     """X always starts; if even number of moves, it's X's turn, else O's."""
-    moves_count = 9 - state.count("-")
-    return "X" if moves_count % 2 == 0 else "O"
-
-def check_winner(state: str) -> Optional[Literal["X", "O", "draw"]]:
-    """Checks win/draw condition for current state string."""
-    lines = [
-        [0,1,2],[3,4,5],[6,7,8],  # Rows
-        [0,3,6],[1,4,7],[2,5,8],  # Cols
-        [0,4,8],[2,4,6],          # Diagonals
-    ]
-    for line in lines:
-        a, b, c = line
-        if state[a] == state[b] == state[c] and state[a] in "XO":
-            return state[a]
-    if "-" not in state:
+    return "X" if move_count % 2 == 0 else "O"
+
+# Winning lines as 9-bit masks; bit i is board index i.
+WIN_MASKS = (
+    0b000_000_111, 0b000_111_000, 0b111_000_000,  # Rows
+    0b001_001_001, 0b010_010_010, 0b100_100_100,  # Cols
+    0b100_010_001, 0b001_010_100,                 # Diagonals
+)
+FULL_BOARD = 0b111_111_111
+
+# Pure function of at most 3^9 reachable boards, so results are memoized without a size bound
+@lru_cache(maxsize=None)
+def check_winner(x_mask: int, o_mask: int) -> Optional[Literal["X", "O", "draw"]]:
+    """Checks win/draw condition for the given X and O board masks."""
+    for mask in WIN_MASKS:
+        if x_mask & mask == mask:
+            return "X"
+        if o_mask & mask == mask:
+            return "O"
+    if x_mask | o_mask == FULL_BOARD:
         return "draw"
     return None
 
@@ -77,46 +83,102 @@ def check_winner(state: str) -> Optional[Literal["X", "O", "draw"]]:
 @router.post("/games", response_model=GameState, summary="Create new game", tags=["Game"])
 async def create_game(payload: GameCreate, db: AsyncSession = Depends(get_db)):
     """Creates a new Tic Tac Toe game between two users. Returns the initial game state."""
-    # Ensure both users exist
-    result = await db.execute(
-        select(User).where(User.id.in_([payload.player_x_id, payload.player_o_id]))
-    )
-    users = result.scalars().all()
-    if len(users) != 2:
+    # Two distinct players are required; existence of each is enforced by the foreign keys on insert
+    if payload.player_x_id == payload.player_o_id:
         raise HTTPException(status_code=404, detail="Both users must exist.")
 
-    game = Game(player_x_id=payload.player_x_id, player_o_id=payload.player_o_id, state="---------", winner=None)
+    game = Game(
+        player_x_id=payload.player_x_id,
+        player_o_id=payload.player_o_id,
+        x_mask=0,
+        o_mask=0,
+        move_history="",
+        move_count=0,
+        winner=None,
+    )
     db.add(game)
-    await db.commit()
-    await db.refresh(game)
-    # Eager load player info for response
-    await db.refresh(game, ["player_x", "player_o", "moves"])
-    return _to_gamestate(game)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=404, detail="Both users must exist.")
+    return await _store_gamestate(await _load_game(db, game.id))
+
+async def _load_game(db: AsyncSession, game_id: int) -> Optional[Game]:
+    """Fetches a game together with both players in a single joined SELECT."""
+    result = await db.execute(
+        select(Game)
+        .where(Game.id == game_id)
+        .options(joinedload(Game.player_x), joinedload(Game.player_o))
+        .execution_options(populate_existing=True)
+    )
+    return result.scalars().first()
 
 def _to_gamestate(game: Game) -> GameState:
     return GameState(
         id=game.id,
-        player_x=UserSchema.from_orm(game.player_x),
-        player_o=UserSchema.from_orm(game.player_o),
+        player_x=UserSchema.model_validate(game.player_x),
+        player_o=UserSchema.model_validate(game.player_o),
         state=game.state,
         winner=game.winner,
-        moves=[move.move_index for move in sorted(game.moves, key=lambda m: m.id)],
+        moves=[int(square) for square in game.move_history],
         created_at=game.created_at.isoformat(),
         updated_at=game.updated_at.isoformat(),
     )
 
+async def _store_gamestate(game: Game) -> GameState:
+    """Builds the response for a freshly written game and writes it through to the cache (best effort)."""
+    game_state = _to_gamestate(game)
+    key = game_state_key(game.id)
+    if not await cache_set(key, game_state.model_dump_json(), version=game.move_count):
+        # Don't leave an older state behind for polls to read until it expires
+        await cache_delete(key)
+    return game_state
+
+def _etag(game_state: GameState) -> str:
+    """Weak validator for a game state; it changes whenever a move is made."""
+    return f'W/"{game_state.updated_at}-{game_state.state}"'
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header (a list of tags or '*') against etag."""
+    if not if_none_match:
+        return False
+    opaque_tag = etag.removeprefix("W/")
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
 # PUBLIC_INTERFACE
-@router.get("/games/{game_id}", response_model=GameState, summary="Get game state", tags=["Game"])
-async def get_game_state(game_id: int, db: AsyncSession = Depends(get_db)):
-    """Get the current state and player info for a game."""
-    result = await db.execute(
-        select(Game).where(Game.id == game_id)
-    )
-    game = result.scalars().first()
-    if not game:
-        raise HTTPException(status_code=404, detail="Game not found")
-    await db.refresh(game, ["player_x", "player_o", "moves"])
-    return _to_gamestate(game)
+@router.get(
+    "/games/{game_id}",
+    response_model=GameState,
+    summary="Get game state",
+    tags=["Game"],
+    responses={304: {"description": "Game state unchanged since the ETag sent in If-None-Match"}},
+)
+async def get_game_state(
+    game_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get the current state and player info for a game. Pollers can send If-None-Match to get a bodyless 304."""
+    cached = await cache_get(game_state_key(game_id))
+    if cached:
+        game_state = GameState.model_validate_json(cached)
+    else:
+        game = await _load_game(db, game_id)
+        if not game:
+            raise HTTPException(status_code=404, detail="Game not found")
+        game_state = _to_gamestate(game)
+        await cache_set(game_state_key(game_id), game_state.model_dump_json(), version=game.move_count)
+    etag = _etag(game_state)
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return game_state
 
 # PUBLIC_INTERFACE
 @router.post("/games/{game_id}/move", response_model=GameState, summary="Make move", tags=["Game"])
@@ -133,50 +195,63 @@ async def make_move(game_id: int, request: MoveRequest, db: AsyncSession = Depen
     if not player_type:
         raise HTTPException(status_code=403, detail="Not a participant in this game")
     # Only correct player can move
-    current_turn = get_current_turn(game.state)
+    current_turn = get_current_turn(game.move_count)
     if player_type != current_turn:
         raise HTTPException(status_code=400, detail=f"It is not {player_type}'s turn")
-    # Valid move index?
-    if not (0 <= request.move_index <= 8):
-        raise HTTPException(status_code=400, detail="move_index must be [0,8]")
-    if game.state[request.move_index] != "-":
+    square = 1 << request.move_index
+    if (game.x_mask | game.o_mask) & square:
         raise HTTPException(status_code=400, detail="Square already taken")
 
-    # Update state string
-    new_state = (
-        game.state[:request.move_index] + player_type + game.state[request.move_index + 1 :]
-    )
-    # Add move
-    move = Move(game_id=game.id, player_id=request.player_id, move_index=request.move_index)
-    db.add(move)
-    game.state = new_state
+    # Place the mark on the player's board mask
+    x_mask = game.x_mask | square if player_type == "X" else game.x_mask
+    o_mask = game.o_mask | square if player_type == "O" else game.o_mask
     # Win/draw detection
-    winner = check_winner(new_state)
-    if winner:
-        game.winner = winner
+    winner = check_winner(x_mask, o_mask)
+    # Compare-and-set on the move count we validated against, so concurrent moves cannot both apply
+    result = await db.execute(
+        update(Game)
+        .where(Game.id == game.id, Game.move_count == game.move_count)
+        .values(
+            x_mask=x_mask,
+            o_mask=o_mask,
+            winner=winner,
+            move_history=game.move_history + str(request.move_index),
+            move_count=Game.move_count + 1,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != 1:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Game state changed, please retry")
     await db.commit()
-    await db.refresh(game)
-    await db.refresh(game, ["player_x", "player_o", "moves"])
-    return _to_gamestate(game)
+    return await _store_gamestate(await _load_game(db, game.id))
+
+async def _load_users(db: AsyncSession, user_ids: Iterable[int]) -> Dict[int, User]:
+    """Fetches the given users with a single `WHERE id IN (...)` query, keyed by id."""
+    user_ids = list(user_ids)
+    if not user_ids:
+        return {}
+    result = await db.execute(select(User).where(User.id.in_(user_ids)))
+    return {user.id: user for user in result.scalars().all()}
 
 # PUBLIC_INTERFACE
 @router.get("/users/{user_id}/games", response_model=List[GameListItem], summary="List games by user", tags=["Game"])
 async def list_games_for_user(user_id: int, db: AsyncSession = Depends(get_db)):
     """Lists all games (with opponent info) that the user participates in."""
-    # Get games where the user is X or O
-    result = await db.execute(
-        select(Game).where(or_(Game.player_x_id == user_id, Game.player_o_id == user_id))
-    )
+    # Get games where the user is X or O. A UNION ALL of two single-column lookups lets MySQL
+    # use each player index, where an OR across both columns tends to fall back to a scan.
+    as_x = select(Game).where(Game.player_x_id == user_id)
+    as_o = select(Game).where(Game.player_o_id == user_id, Game.player_x_id != user_id)
+    result = await db.execute(select(Game).from_statement(union_all(as_x, as_o)))
     games = result.scalars().all()
+    # Fetch every distinct opponent in one batched query instead of loading both players per game
+    opponents = await _load_users(
+        db, {g.player_o_id if g.player_x_id == user_id else g.player_x_id for g in games}
+    )
     res: List[GameListItem] = []
     for g in games:
         # Determine opponent user
-        if g.player_x_id == user_id:
-            await db.refresh(g, ["player_o"])
-            opponent = g.player_o
-        else:
-            await db.refresh(g, ["player_x"])
-            opponent = g.player_x
+        opponent = opponents[g.player_o_id if g.player_x_id == user_id else g.player_x_id]
         res.append(
             GameListItem(
                 id=g.id,
@@ -184,7 +259,7 @@ async def list_games_for_user(user_id: int, db: AsyncSession = Depends(get_db)):
                 winner=g.winner,
                 created_at=g.created_at.isoformat(),
                 updated_at=g.updated_at.isoformat(),
-                opponent=UserSchema.from_orm(opponent),
+                opponent=UserSchema.model_validate(opponent),
             )
         )
     return res
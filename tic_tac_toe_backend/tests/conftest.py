@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from src.api import cache
+from src.api.db import Base, get_db
+from src.api.main import app
+from src.api.models import User
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Path of the SQLite file backing the test database."""
+    return tmp_path / "test.db"
+
+
+@pytest.fixture
+def client(db_path, monkeypatch):
+    """TestClient against a fresh SQLite database seeded with users 1-3, with the Redis cache disabled."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_foreign_keys(dbapi_connection, _):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+
+    async def setup():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with session_factory() as session:
+            session.add_all([User(id=user_id, username=f"player{user_id}") for user_id in (1, 2, 3)])
+            await session.commit()
+
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    asyncio.run(setup())
+    monkeypatch.setattr(cache, "redis_client", None)
+    monkeypatch.setattr(cache, "_set_if_newer", None)
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def game_id(client):
+    """A new game with user 1 as X and user 2 as O."""
+    response = client.post("/games", json={"player_x_id": 1, "player_o_id": 2})
+    assert response.status_code == 200
+    return response.json()["id"]
+
+
+@pytest.fixture
+def redis_cache(client, monkeypatch):
+    """Enables the game-state cache against an in-memory Redis that can run the cache's Lua script."""
+    redis_client = FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(cache, "redis_client", redis_client)
+    monkeypatch.setattr(cache, "_set_if_newer", redis_client.register_script(cache._SET_IF_NEWER))
+    return redis_client
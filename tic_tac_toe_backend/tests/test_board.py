@@ -0,0 +1,53 @@
+import pytest
+
+from src.api.models import Game
+from src.api.routes import check_winner
+
+
+def masks(state):
+    """X and O bitmasks for a 9-char board string."""
+    x_mask = sum(1 << i for i, square in enumerate(state) if square == "X")
+    o_mask = sum(1 << i for i, square in enumerate(state) if square == "O")
+    return x_mask, o_mask
+
+
+@pytest.mark.parametrize("state", ["---------", "X---O----", "XOXOXOOXO", "-------OX"])
+def test_game_state_renders_masks(state):
+    x_mask, o_mask = masks(state)
+    assert Game(x_mask=x_mask, o_mask=o_mask).state == state
+
+
+@pytest.mark.parametrize(
+    "state, winner",
+    [
+        ("---------", None),
+        ("XXXOO----", "X"),
+        ("XO-XO-X--", "X"),
+        ("XXO-O-O-X", "O"),
+        ("OX--O-X-O", "O"),
+        ("XOXXOOOXX", "draw"),
+        ("XOXXOOOX-", None),
+    ],
+)
+def test_check_winner(state, winner):
+    assert check_winner(*masks(state)) == winner
+
+
+def test_taken_square_is_rejected(client, game_id):
+    assert client.post(f"/games/{game_id}/move", json={"player_id": 1, "move_index": 4}).status_code == 200
+    response = client.post(f"/games/{game_id}/move", json={"player_id": 2, "move_index": 4})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Square already taken"
+
+
+def test_winning_move_finishes_game(client, game_id):
+    for player_id, move_index in [(1, 0), (2, 3), (1, 1), (2, 4)]:
+        client.post(f"/games/{game_id}/move", json={"player_id": player_id, "move_index": move_index})
+    body = client.post(f"/games/{game_id}/move", json={"player_id": 1, "move_index": 2}).json()
+    assert body["state"] == "XXXOO----"
+    assert body["winner"] == "X"
+    assert body["moves"] == [0, 3, 1, 4, 2]
+
+    response = client.post(f"/games/{game_id}/move", json={"player_id": 2, "move_index": 5})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Game already finished"
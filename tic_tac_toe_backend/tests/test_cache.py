@@ -0,0 +1,49 @@
+import asyncio
+import sqlite3
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.api import cache
+
+
+def test_move_writes_through_and_get_is_served_from_cache(client, game_id, redis_cache, db_path):
+    client.post(f"/games/{game_id}/move", json={"player_id": 1, "move_index": 0})
+    assert asyncio.run(redis_cache.hget(cache.game_state_key(game_id), "version")) == "1"
+
+    # Clear the board behind the cache's back; a cached read still returns the written-through state
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE games SET x_mask = 0 WHERE id = ?", (game_id,))
+    response = client.get(f"/games/{game_id}")
+    assert response.status_code == 200
+    assert response.json()["state"] == "X--------"
+
+
+def test_older_version_does_not_overwrite_newer_state(client, game_id, redis_cache):
+    key = cache.game_state_key(game_id)
+    client.post(f"/games/{game_id}/move", json={"player_id": 1, "move_index": 0})
+    newer = asyncio.run(cache.cache_get(key))
+
+    assert asyncio.run(cache.cache_set(key, "stale", version=0))
+    assert asyncio.run(cache.cache_get(key)) == newer
+    assert client.get(f"/games/{game_id}").json()["state"] == "X--------"
+
+
+def test_redis_errors_fall_back_to_database(client, game_id, redis_cache, monkeypatch):
+    key = cache.game_state_key(game_id)
+    client.get(f"/games/{game_id}")
+    assert asyncio.run(redis_cache.exists(key))
+
+    async def unavailable(*args, **kwargs):
+        raise RedisConnectionError("Redis is down")
+
+    monkeypatch.setattr(redis_cache, "hget", unavailable)
+    monkeypatch.setattr(cache, "_set_if_newer", unavailable)
+
+    response = client.post(f"/games/{game_id}/move", json={"player_id": 1, "move_index": 0})
+    assert response.status_code == 200
+    # The failed write-through evicts the pre-move state instead of leaving it to be served
+    assert not asyncio.run(redis_cache.exists(key))
+
+    response = client.get(f"/games/{game_id}")
+    assert response.status_code == 200
+    assert response.json()["state"] == "X--------"
@@ -0,0 +1,21 @@
+def test_create_game_returns_empty_board(client):
+    response = client.post("/games", json={"player_x_id": 1, "player_o_id": 2})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["player_x"] == {"id": 1, "username": "player1"}
+    assert body["player_o"] == {"id": 2, "username": "player2"}
+    assert body["state"] == "---------"
+    assert body["moves"] == []
+    assert body["created_at"] and body["updated_at"]
+
+
+def test_create_game_with_unknown_user_returns_404(client):
+    response = client.post("/games", json={"player_x_id": 1, "player_o_id": 999})
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Both users must exist."
+    assert client.get("/users/1/games").json() == []
+
+
+def test_create_game_against_self_returns_404(client):
+    response = client.post("/games", json={"player_x_id": 1, "player_o_id": 1})
+    assert response.status_code == 404
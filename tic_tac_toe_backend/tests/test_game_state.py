@@ -0,0 +1,31 @@
+def test_get_game_state_sends_weak_etag(client, game_id):
+    response = client.get(f"/games/{game_id}")
+    assert response.status_code == 200
+    assert response.headers["etag"].startswith('W/"')
+
+
+def test_get_unknown_game_returns_404(client):
+    assert client.get("/games/999").status_code == 404
+
+
+def test_matching_if_none_match_returns_304(client, game_id):
+    etag = client.get(f"/games/{game_id}").headers["etag"]
+    response = client.get(f"/games/{game_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_if_none_match_uses_weak_comparison(client, game_id):
+    etag = client.get(f"/games/{game_id}").headers["etag"]
+    for header in (etag.removeprefix("W/"), f'W/"stale", {etag}', "*"):
+        assert client.get(f"/games/{game_id}", headers={"If-None-Match": header}).status_code == 304
+
+
+def test_move_changes_etag(client, game_id):
+    etag = client.get(f"/games/{game_id}").headers["etag"]
+    client.post(f"/games/{game_id}/move", json={"player_id": 1, "move_index": 0})
+    response = client.get(f"/games/{game_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["state"] == "X--------"
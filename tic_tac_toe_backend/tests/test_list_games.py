@@ -0,0 +1,23 @@
+def test_lists_games_as_x_and_as_o_with_opponents(client):
+    as_x = client.post("/games", json={"player_x_id": 1, "player_o_id": 2}).json()["id"]
+    as_o = client.post("/games", json={"player_x_id": 3, "player_o_id": 1}).json()["id"]
+    client.post("/games", json={"player_x_id": 2, "player_o_id": 3})
+
+    games = client.get("/users/1/games").json()
+    assert sorted(game["id"] for game in games) == sorted([as_x, as_o])
+    opponents = {game["id"]: game["opponent"] for game in games}
+    assert opponents[as_x] == {"id": 2, "username": "player2"}
+    assert opponents[as_o] == {"id": 3, "username": "player3"}
+
+
+def test_same_opponent_in_several_games(client):
+    first = client.post("/games", json={"player_x_id": 1, "player_o_id": 2}).json()["id"]
+    second = client.post("/games", json={"player_x_id": 2, "player_o_id": 1}).json()["id"]
+
+    games = client.get("/users/2/games").json()
+    assert sorted(game["id"] for game in games) == sorted([first, second])
+    assert all(game["opponent"] == {"id": 1, "username": "player1"} for game in games)
+
+
+def test_user_without_games_gets_empty_list(client):
+    assert client.get("/users/3/games").json() == []
@@ -0,0 +1,52 @@
+import sqlite3
+
+from src.api import routes
+from src.api.routes import get_current_turn
+
+
+def test_current_turn_alternates_from_x():
+    assert [get_current_turn(count) for count in range(4)] == ["X", "O", "X", "O"]
+
+
+def test_move_updates_board(client, game_id):
+    response = client.post(f"/games/{game_id}/move", json={"player_id": 1, "move_index": 4})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["state"] == "----X----"
+    assert body["moves"] == [4]
+    assert body["winner"] is None
+
+
+def test_concurrent_move_returns_conflict(client, game_id, db_path, monkeypatch):
+    check_winner = routes.check_winner
+
+    def racing_check_winner(x_mask, o_mask):
+        # Another request commits a move between our read and our compare-and-set
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("UPDATE games SET move_count = move_count + 1 WHERE id = ?", (game_id,))
+        return check_winner(x_mask, o_mask)
+
+    monkeypatch.setattr(routes, "check_winner", racing_check_winner)
+    response = client.post(f"/games/{game_id}/move", json={"player_id": 1, "move_index": 0})
+    assert response.status_code == 409
+
+    monkeypatch.setattr(routes, "check_winner", check_winner)
+    state = client.get(f"/games/{game_id}").json()
+    assert state["state"] == "---------"
+    assert state["moves"] == []
+
+
+def test_players_must_alternate_turns(client, game_id):
+    response = client.post(f"/games/{game_id}/move", json={"player_id": 2, "move_index": 0})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "It is not O's turn"
+
+    assert client.post(f"/games/{game_id}/move", json={"player_id": 1, "move_index": 0}).status_code == 200
+    response = client.post(f"/games/{game_id}/move", json={"player_id": 1, "move_index": 1})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "It is not X's turn"
+
+
+def test_non_participant_cannot_move(client, game_id):
+    response = client.post(f"/games/{game_id}/move", json={"player_id": 3, "move_index": 0})
+    assert response.status_code == 403